@@ -14,12 +14,13 @@ import weewx
 def parse_dates(date=None, from_date=None, to_date=None, as_datetime=False):
     """Parse --date, --from and --to command line options.
 
-        Parses --date or --from and --to.
+        Parses --date or --from and --to. The values may already have been converted into
+        datetime.date objects (for example, by argparse), in which case they are used as is.
 
         Args:
-            date(str|None): In the form YYYY-mm-dd
-            from_date(str|None): Any ISO 8601 acceptable date or datetime.
-            to_date(str|None): Any ISO 8601 acceptable date or datetime.
+            date(str|datetime.date|None): In the form YYYY-mm-dd
+            from_date(str|datetime.date|None): Any ISO 8601 acceptable date or datetime.
+            to_date(str|datetime.date|None): Any ISO 8601 acceptable date or datetime.
             as_datetime(bool): True, return a datetime.datetime object. Otherwise, return
                 a datetime.date object.
 
@@ -28,6 +29,16 @@ def parse_dates(date=None, from_date=None, to_date=None, as_datetime=False):
                 as datetime.datetime objects (as_datetime==True), or datetime.date (False).
     """
 
+    def _convert(val):
+        if isinstance(val, datetime.date):
+            # Already converted. Just make sure it's the right kind of object.
+            if as_datetime and not isinstance(val, datetime.datetime):
+                return datetime.datetime.combine(val, datetime.time())
+            return val
+        if as_datetime:
+            return datetime.datetime.fromisoformat(val)
+        return datetime.date.fromisoformat(val)
+
     # default is None, unless user has specified an option
     from_val = to_val = None
 
@@ -39,10 +50,7 @@ def parse_dates(date=None, from_date=None, to_date=None, as_datetime=False):
 
         # there is a --date but is it valid
         try:
-            if as_datetime:
-                from_val = to_val = datetime.datetime.fromisoformat(date)
-            else:
-                from_val = to_val = datetime.date.fromisoformat(date)
+            from_val = to_val = _convert(date)
         except ValueError:
             raise ValueError("Invalid --date option specified.")
 
@@ -50,19 +58,13 @@ def parse_dates(date=None, from_date=None, to_date=None, as_datetime=False):
         # we don't have --date. Look for --from and/or --to
         if from_date:
             try:
-                if as_datetime:
-                    from_val = datetime.datetime.fromisoformat(from_date)
-                else:
-                    from_val = datetime.date.fromisoformat(from_date)
+                from_val = _convert(from_date)
             except ValueError:
                 raise ValueError("Invalid --from option specified.")
 
         if to_date:
             try:
-                if as_datetime:
-                    to_val = datetime.datetime.fromisoformat(to_date)
-                else:
-                    to_val = datetime.date.fromisoformat(to_date)
+                to_val = _convert(to_date)
             except ValueError:
                 raise ValueError("Invalid --to option specified.")
 
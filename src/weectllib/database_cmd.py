@@ -5,66 +5,59 @@
 #
 """Manage a WeeWX database."""
 import argparse
+import datetime
+import functools
+import os
+import sys
 
 import weecfg
-import weecfg.database
 import weectllib
-import weectllib.database_actions
+import weewx.manager
 from weeutil.weeutil import bcolors
 
-create_usage = f"""{bcolors.BOLD}weectl database create
+
+_action_usages = {
+    'create': """weectl database create
             [--config=FILENAME] [--binding=BINDING-NAME]
-            [--dry-run] [-y]{bcolors.ENDC}"""
-drop_daily_usage = f"""{bcolors.BOLD}weectl database drop-daily
+            [--dry-run] [-y]""",
+    'drop-daily': """weectl database drop-daily
             [--config=FILENAME] [--binding=BINDING-NAME]
-            [--dry-run] [-y]{bcolors.ENDC}"""
-rebuild_usage = f"""{bcolors.BOLD}weectl database rebuild-daily
+            [--dry-run] [-y]""",
+    'rebuild-daily': """weectl database rebuild-daily
             [[--date=YYYY-mm-dd] | [--from=YYYY-mm-dd] [--to=YYYY-mm-dd]]
             [--config=FILENAME] [--binding=BINDING-NAME] 
-            [--dry-run] [-y]{bcolors.ENDC}"""
-add_column_usage = f"""{bcolors.BOLD}weectl database add-column NAME
+            [--dry-run] [-y]""",
+    'add-column': """weectl database add-column NAME
             [--type=COLUMN-DEF]
             [--config=FILENAME] [--binding=BINDING-NAME]
-            [--dry-run] [-y]{bcolors.ENDC}"""
-rename_column_usage = f"""{bcolors.BOLD}weectl database rename-column FROM-NAME TO-NAME
+            [--dry-run] [-y]""",
+    'rename-column': """weectl database rename-column FROM-NAME TO-NAME
             [--config=FILENAME] [--binding=BINDING-NAME]
-            [--dry-run] [-y]{bcolors.ENDC}"""
-drop_columns_usage = f"""{bcolors.BOLD}weectl database drop-columns NAME...
+            [--dry-run] [-y]""",
+    'drop-columns': """weectl database drop-columns NAME...
             [--config=FILENAME] [--binding=BINDING-NAME]
-            [--dry-run] [-y]{bcolors.ENDC}"""
-reconfigure_usage = f"""{bcolors.BOLD}weectl database reconfigure 
+            [--dry-run] [-y]""",
+    'reconfigure': """weectl database reconfigure 
             [--config=FILENAME] [--binding=BINDING-NAME]
-            [--dry-run] [-y]{bcolors.ENDC}"""
-transfer_usage = f"""{bcolors.BOLD}weectl database transfer --dest-binding=BINDING-NAME
+            [--dry-run] [-y]""",
+    'transfer': """weectl database transfer --dest-binding=BINDING-NAME
             [--config=FILENAME] [--binding=BINDING-NAME]
-            [--dry-run] [-y]{bcolors.ENDC}"""
-calc_missing_usage = f"""{bcolors.BOLD}weectl database calc-missing
+            [--dry-run] [-y]""",
+    'calc-missing': """weectl database calc-missing
             [--date=YYYY-mm-dd | [--from=YYYY-mm-dd[THH:MM]] [--to=YYYY-mm-dd[THH:MM]]]
             [--config=FILENAME] [--binding=BINDING-NAME] [--tranche=INT]
-            [--dry-run] [-y]{bcolors.ENDC}"""
-check_usage = f"""{bcolors.BOLD}weectl database check
-            [--config=FILENAME] [--binding=BINDING-NAME]{bcolors.ENDC}"""
-update_usage = f"""{bcolors.BOLD}weectl database update
+            [--dry-run] [-y]""",
+    'check': """weectl database check
+            [--config=FILENAME] [--binding=BINDING-NAME]""",
+    'update': """weectl database update
             [--config=FILENAME] [--binding=BINDING-NAME]
-            [--dry-run] [-y]{bcolors.ENDC}"""
-reweight_usage = f"""{bcolors.BOLD}weectl database reweight
+            [--dry-run] [-y]""",
+    'reweight': """weectl database reweight
             [[--date=YYYY-mm-dd] | [--from=YYYY-mm-dd] [--to=YYYY-mm-dd]]
             [--config=FILENAME] [--binding=BINDING-NAME] 
-            [--dry-run] [-y]{bcolors.ENDC}"""
-
-database_usage = '\n       '.join((create_usage,
-                                   drop_daily_usage,
-                                   rebuild_usage,
-                                   add_column_usage,
-                                   rename_column_usage,
-                                   drop_columns_usage,
-                                   reconfigure_usage,
-                                   transfer_usage,
-                                   calc_missing_usage,
-                                   check_usage,
-                                   update_usage,
-                                   reweight_usage
-                                   ))
+            [--dry-run] [-y]""",
+}
+
 
 drop_columns_description = """Drop (remove) one or more columns from a WeeWX database.
 This command allows you to drop more than one column at once.
@@ -84,14 +77,62 @@ update_description = """Update the database to the current version. This is only
 databases created before v3.7 and never updated. Before updating, this utility will check 
 whether it is necessary."""
 
+_action_help = {
+    'create': 'Create a new WeeWX database.',
+    'drop-daily': 'Drop the daily summary from a WeeWX database.',
+    'rebuild-daily': 'Rebuild the daily summary in a WeeWX database.',
+    'add-column': 'Add a column to an existing WeeWX database.',
+    'rename-column': 'Rename a column in an existing WeeWX database.',
+    'drop-columns': 'Drop (remove) one or more columns from a WeeWX database.',
+    'reconfigure': 'Reconfigure a database, using the current configuration information in '
+                   'the config file.',
+    'transfer': 'Copy a database to a new database.',
+    'calc-missing': 'Calculate and store any missing derived observations.',
+    'check': 'Check the database for any issues.',
+    'update': 'Update the database to the current version.',
+    'reweight': 'Recalculate the weighted sums in the daily summaries.',
+}
+
+# Column types that get translated into their standard SQL spelling
+_column_type_aliases = {'INT': 'INTEGER'}
+
+_database_help = "Manage WeeWX databases."
+_database_description = "Manages WeeWX databases"
+
+# Help for the options shared by the actions
+_binding_help = "The data binding to use. Default is 'wx_binding'."
+_dry_run_help = "Print what would happen, but do not actually do it."
+_yes_help = "Don't ask for confirmation. Just do it."
+
 epilog = "Before taking a mutating action, make a backup!"
 
 
 def add_subparser(subparsers):
+    """Add the parsers used to implement the 'database' command.
+
+    To save time, what gets built depends on the command line, which is read from sys.argv,
+    not from whatever is later passed to parse_args(). Only the parser for the action named on
+    the command line is fully built; the others are stubs that are only good for listing the
+    action in the help. So, sys.argv must hold the command line that is going to be parsed.
+    """
+    database_args = _database_args(sys.argv)
+
+    # Some other subcommand is being run. Just register the name so it shows up in the
+    # top-level help.
+    if database_args is None:
+        subparsers.add_parser('database', help=_database_help)
+        return
+
+    chosen = _find_action(database_args)
+    # The full usage, covering every action, is only shown if no valid action was given.
+    if chosen is None:
+        database_usage = _database_usage()
+    else:
+        database_usage = 'weectl database ACTION'
     database_parser = subparsers.add_parser('database',
                                             usage=database_usage,
-                                            description='Manages WeeWX databases',
-                                            help="Manage WeeWX databases.",
+                                            description=_database_description,
+                                            help=_database_help,
                                             epilog=epilog)
     # In the following, the 'prog' argument is necessary to get a proper error message.
     # See Python issue https://bugs.python.org/issue42297
@@ -99,58 +140,126 @@ def add_subparser(subparsers):
                                                    prog='weectl database',
                                                    title="Which action to take")
 
-    # ---------- Action 'create' ----------
+    # Only the action actually named on the command line gets a fully built parser. The rest
+    # get a bare stub, which is enough for them to show up in the help and the list of choices.
+    for action, action_help in _action_help.items():
+        if action == chosen:
+            _action_builders[action](action_parser)
+        else:
+            action_parser.add_parser(action, help=action_help)
+
+
+def _database_args(argv):
+    """Return the command line arguments following the 'database' subcommand, or None if some
+    other subcommand is being run."""
+    # The subcommand is the first positional argument
+    for i, arg in enumerate(argv[1:], start=1):
+        if not arg.startswith('-'):
+            return argv[i + 1:] if arg == 'database' else None
+    return None
+
+
+def _find_action(database_args):
+    """Return the database action named on the command line, or None if there is none.
+
+    The action must come right after the subcommand. If anything else comes first (such as
+    --help), then it is the 'database' parser that will be doing the talking, so no action is
+    returned.
+    """
+    if database_args and database_args[0] in _action_builders:
+        return database_args[0]
+    return None
+
+
+def _usage(action):
+    """Return the usage string for the given action. It is shown in bold, unless the output is
+    not going to a terminal, or the user has asked for no color by setting NO_COLOR."""
+    if _usage_stream().isatty() and not os.environ.get('NO_COLOR'):
+        return f"{bcolors.BOLD}{_action_usages[action]}{bcolors.ENDC}"
+    return _action_usages[action]
+
+
+def _usage_stream():
+    """Return the stream the usage will be written to. argparse writes help to stdout, but the
+    usage that goes with an error message to stderr."""
+    if '-h' in sys.argv or '--help' in sys.argv:
+        return sys.stdout
+    return sys.stderr
+
+
+def _database_usage():
+    """Return the usage string for the 'database' subcommand, which covers every action."""
+    return '\n       '.join(_usage(action) for action in _action_usages)
+
+
+def _build_create(action_parser):
+    """Add the parser for action 'create'."""
     create_parser = action_parser.add_parser('create',
                                              description="Create a new WeeWX database",
-                                             usage=create_usage,
-                                             help='Create a new WeeWX database.',
+                                             parents=[_common_parser()],
+                                             usage=_usage('create'),
+                                             help=_action_help['create'],
                                              epilog=epilog)
-    _add_common_args(create_parser)
     create_parser.set_defaults(func=weectllib.dispatch)
-    create_parser.set_defaults(action_func=create_database)
+    create_parser.set_defaults(action_func=run_action)
 
-    # ---------- Action 'drop-daily' ----------
+
+def _build_drop_daily(action_parser):
+    """Add the parser for action 'drop-daily'."""
     drop_daily_parser = action_parser.add_parser('drop-daily',
                                                  description="Drop the daily summary from a "
                                                              "WeeWX database",
-                                                 usage=drop_daily_usage,
-                                                 help="Drop the daily summary from a "
-                                                      "WeeWX database.",
+                                                 parents=[_common_parser()],
+                                                 usage=_usage('drop-daily'),
+                                                 help=_action_help['drop-daily'],
                                                  epilog=epilog)
-    _add_common_args(drop_daily_parser)
     drop_daily_parser.set_defaults(func=weectllib.dispatch)
-    drop_daily_parser.set_defaults(action_func=drop_daily)
+    drop_daily_parser.set_defaults(action_func=run_action)
+
 
-    # ---------- Action 'rebuild-daily' ----------
+def _build_rebuild_daily(action_parser):
+    """Add the parser for action 'rebuild-daily'."""
     rebuild_parser = action_parser.add_parser('rebuild-daily',
                                               description="Rebuild the daily summary in "
                                                           "a WeeWX database",
-                                              usage=rebuild_usage,
-                                              help="Rebuild the daily summary in "
-                                                   "a WeeWX database.",
+                                              parents=[_common_parser()],
+                                              usage=_usage('rebuild-daily'),
+                                              help=_action_help['rebuild-daily'],
                                               epilog=epilog)
     rebuild_parser.add_argument("--date",
                                 metavar="YYYY-mm-dd",
+                                type=_date,
                                 help="Rebuild for this date only.")
     rebuild_parser.add_argument("--from",
                                 metavar="YYYY-mm-dd",
+                                type=_date,
                                 dest='from_date',
                                 help="Rebuild starting with this date.")
     rebuild_parser.add_argument("--to",
                                 metavar="YYYY-mm-dd",
+                                type=_date,
                                 dest='to_date',
                                 help="Rebuild ending with this date.")
-    _add_common_args(rebuild_parser)
     rebuild_parser.set_defaults(func=weectllib.dispatch)
-    rebuild_parser.set_defaults(action_func=rebuild_daily)
+    rebuild_parser.set_defaults(action_func=run_action)
+
+
+def _date(date_str):
+    """Convert a date given on the command line into a datetime.date object."""
+    try:
+        return datetime.date.fromisoformat(date_str)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid date '{date_str}'. Use the form YYYY-mm-dd.")
 
-    # ---------- Action 'add-column' ----------
+
+def _build_add_column(action_parser):
+    """Add the parser for action 'add-column'."""
     add_column_parser = action_parser.add_parser('add-column',
                                                  description="Add a column to an "
                                                              "existing WeeWX database.",
-                                                 usage=add_column_usage,
-                                                 help="Add a column to an "
-                                                      "existing WeeWX database.",
+                                                 parents=[_common_parser()],
+                                                 usage=_usage('add-column'),
+                                                 help=_action_help['add-column'],
                                                  epilog=epilog)
     add_column_parser.add_argument('column_name',
                                    metavar='NAME',
@@ -159,18 +268,26 @@ def add_subparser(subparsers):
                                    default='REAL',
                                    metavar='COLUMN-DEF',
                                    dest='column_type',
+                                   type=_column_type,
                                    help="Any valid SQL column definition. Default is 'REAL'.")
-    _add_common_args(add_column_parser)
     add_column_parser.set_defaults(func=weectllib.dispatch)
-    add_column_parser.set_defaults(action_func=add_column)
+    add_column_parser.set_defaults(action_func=run_action)
+
+
+def _column_type(column_type):
+    """Normalize the column type given to 'add-column'."""
+    column_type = column_type.upper()
+    return _column_type_aliases.get(column_type, column_type)
+
 
-    # ---------- Action 'rename-column' ----------
+def _build_rename_column(action_parser):
+    """Add the parser for action 'rename-column'."""
     rename_column_parser = action_parser.add_parser('rename-column',
                                                     description="Rename a column in an "
                                                                 "existing WeeWX database.",
-                                                    usage=rename_column_usage,
-                                                    help="Rename a column in an "
-                                                         "existing WeeWX database.",
+                                                    parents=[_common_parser()],
+                                                    usage=_usage('rename-column'),
+                                                    help=_action_help['rename-column'],
                                                     epilog=epilog)
     rename_column_parser.add_argument('from_name',
                                       metavar='FROM-NAME',
@@ -178,16 +295,17 @@ def add_subparser(subparsers):
     rename_column_parser.add_argument('to_name',
                                       metavar='TO-NAME',
                                       help="New name of the column.")
-    _add_common_args(rename_column_parser)
     rename_column_parser.set_defaults(func=weectllib.dispatch)
-    rename_column_parser.set_defaults(action_func=rename_column)
+    rename_column_parser.set_defaults(action_func=run_action)
 
-    # ---------- Action 'drop-columns' ----------
+
+def _build_drop_columns(action_parser):
+    """Add the parser for action 'drop-columns'."""
     drop_columns_parser = action_parser.add_parser('drop-columns',
                                                    description=drop_columns_description,
-                                                   usage=drop_columns_usage,
-                                                   help="Drop (remove) one or more columns "
-                                                        "from a WeeWX database.",
+                                                   parents=[_common_parser()],
+                                                   usage=_usage('drop-columns'),
+                                                   help=_action_help['drop-columns'],
                                                    formatter_class=argparse.RawDescriptionHelpFormatter,
                                                    epilog=epilog)
     drop_columns_parser.add_argument('column_names',
@@ -195,44 +313,47 @@ def add_subparser(subparsers):
                                      metavar='NAME',
                                      help="Column(s) to be dropped. "
                                           "More than one NAME can be specified.")
-    _add_common_args(drop_columns_parser)
     drop_columns_parser.set_defaults(func=weectllib.dispatch)
-    drop_columns_parser.set_defaults(action_func=drop_columns)
+    drop_columns_parser.set_defaults(action_func=run_action)
+
 
-    # ---------- Action 'reconfigure' ----------
+def _build_reconfigure(action_parser):
+    """Add the parser for action 'reconfigure'."""
     reconfigure_parser = action_parser.add_parser('reconfigure',
                                                   description=reconfigure_description,
-                                                  usage=reconfigure_usage,
-                                                  help="Reconfigure a database, using the current "
-                                                       "configuration information in the config "
-                                                       "file.",
+                                                  parents=[_common_parser()],
+                                                  usage=_usage('reconfigure'),
+                                                  help=_action_help['reconfigure'],
                                                   epilog=epilog)
-    _add_common_args(reconfigure_parser)
     reconfigure_parser.set_defaults(func=weectllib.dispatch)
-    reconfigure_parser.set_defaults(action_func=reconfigure_database)
+    reconfigure_parser.set_defaults(action_func=run_action)
 
-    # ---------- Action 'transfer' ----------
+
+def _build_transfer(action_parser):
+    """Add the parser for action 'transfer'."""
     transfer_parser = action_parser.add_parser('transfer',
                                                description=transfer_description,
-                                               usage=transfer_usage,
-                                               help="Copy a database to a new database.",
+                                               parents=[_common_parser()],
+                                               usage=_usage('transfer'),
+                                               help=_action_help['transfer'],
                                                epilog=epilog)
     transfer_parser.add_argument('--dest-binding',
                                  metavar='BINDING-NAME',
                                  required=True,
                                  help="A database binding pointing to the destination "
                                       "database. Required.")
-    _add_common_args(transfer_parser)
     transfer_parser.set_defaults(func=weectllib.dispatch)
-    transfer_parser.set_defaults(action_func=transfer_database)
+    transfer_parser.set_defaults(action_func=run_action)
+
 
-    # ---------- Action 'calc-missing' ----------
+def _build_calc_missing(action_parser):
+    """Add the parser for action 'calc-missing'."""
     calc_missing_parser = action_parser.add_parser('calc-missing',
                                                    description="Calculate and store any missing "
                                                                "derived observations.",
-                                                   usage=calc_missing_usage,
-                                                   help="Calculate and store any missing "
-                                                        "derived observations.",
+                                                   parents=[_common_parser()],
+                                                   usage=_usage('calc-missing'),
+                                                   help=_action_help['calc-missing'],
                                                    epilog=epilog)
     calc_missing_parser.add_argument("--date",
                                      metavar="YYYY-mm-dd",
@@ -251,184 +372,144 @@ def add_subparser(subparsers):
                                      default=10,
                                      help="Perform database transactions on INT days "
                                           "of records at a time. Default is 10.")
-    _add_common_args(calc_missing_parser)
     calc_missing_parser.set_defaults(func=weectllib.dispatch)
-    calc_missing_parser.set_defaults(action_func=calc_missing)
+    calc_missing_parser.set_defaults(action_func=run_action)
 
-    # ---------- Action 'check' ----------
+
+def _build_check(action_parser):
+    """Add the parser for action 'check'."""
     check_parser = action_parser.add_parser('check',
                                             description="Check the database for any issues.",
-                                            usage=check_usage,
-                                            help="Check the database for any issues.")
-    check_parser.add_argument('--config',
-                              metavar='FILENAME',
-                              help=f'Path to configuration file. '
-                                   f'Default is "{weecfg.default_config_path}".')
-    check_parser.add_argument("--binding", metavar="BINDING-NAME",
-                              default='wx_binding',
-                              help="The data binding to use. Default is 'wx_binding'.")
+                                            parents=[_common_parser(mutating=False)],
+                                            usage=_usage('check'),
+                                            help=_action_help['check'])
     check_parser.set_defaults(func=weectllib.dispatch)
-    check_parser.set_defaults(action_func=check)
+    check_parser.set_defaults(action_func=run_action)
+
 
-    # ---------- Action 'update' ----------
+def _build_update(action_parser):
+    """Add the parser for action 'update'."""
     update_parser = action_parser.add_parser('update',
                                              description=update_description,
-                                             usage=update_usage,
-                                             help="Update the database to the current version.",
+                                             parents=[_common_parser()],
+                                             usage=_usage('update'),
+                                             help=_action_help['update'],
                                              epilog=epilog)
 
-    _add_common_args(update_parser)
     update_parser.set_defaults(func=weectllib.dispatch)
-    update_parser.set_defaults(action_func=update_database)
+    update_parser.set_defaults(action_func=run_action)
+
 
-    # ---------- Action 'reweight' ----------
+def _build_reweight(action_parser):
+    """Add the parser for action 'reweight'."""
     reweight_parser = action_parser.add_parser('reweight',
                                                description="Recalculate the weighted sums in "
                                                            "the daily summaries.",
-                                               usage=reweight_usage,
-                                               help="Recalculate the weighted sums in "
-                                                    "the daily summaries.",
+                                               parents=[_common_parser()],
+                                               usage=_usage('reweight'),
+                                               help=_action_help['reweight'],
                                                epilog=epilog)
     reweight_parser.add_argument("--date",
                                  metavar="YYYY-mm-dd",
+                                 type=_date,
                                  help="Reweight for this date only.")
     reweight_parser.add_argument("--from",
                                  metavar="YYYY-mm-dd",
+                                 type=_date,
                                  dest='from_date',
                                  help="Reweight starting with this date.")
     reweight_parser.add_argument("--to",
                                  metavar="YYYY-mm-dd",
+                                 type=_date,
                                  dest='to_date',
                                  help="Reweight ending with this date.")
-    _add_common_args(reweight_parser)
     reweight_parser.set_defaults(func=weectllib.dispatch)
-    reweight_parser.set_defaults(action_func=reweight_daily)
-
-
-# ------------------ Shims for calling database action functions ---------------- #
-def create_database(config_dict, namespace):
-    """Create the WeeWX database"""
-
-    weectllib.database_actions.create_database(config_dict,
-                                               db_binding=namespace.binding,
-                                               dry_run=namespace.dry_run,
-                                               no_confirm=namespace.yes)
-
-
-def drop_daily(config_dict, namespace):
-    """Drop the daily summary from a WeeWX database"""
-    weectllib.database_actions.drop_daily(config_dict,
-                                          db_binding=namespace.binding,
-                                          dry_run=namespace.dry_run,
-                                          no_confirm=namespace.yes)
-
-
-def rebuild_daily(config_dict, namespace):
-    """Rebuild the daily summary in a WeeWX database"""
-    weectllib.database_actions.rebuild_daily(config_dict,
-                                             date=namespace.date,
-                                             from_date=namespace.from_date,
-                                             to_date=namespace.to_date,
-                                             db_binding=namespace.binding,
-                                             dry_run=namespace.dry_run,
-                                             no_confirm=namespace.yes)
-
-
-def add_column(config_dict, namespace):
-    """Add a column to a WeeWX database"""
-    column_type = namespace.column_type.upper()
-    if column_type == 'INT':
-        column_type = "INTEGER"
-    weectllib.database_actions.add_column(config_dict,
-                                          column_name=namespace.column_name,
-                                          column_type=column_type,
-                                          db_binding=namespace.binding,
-                                          dry_run=namespace.dry_run,
-                                          no_confirm=namespace.yes)
-
-
-def rename_column(config_dict, namespace):
-    """Rename a column in a WeeWX database."""
-    weectllib.database_actions.rename_column(config_dict,
-                                             from_name=namespace.from_name,
-                                             to_name=namespace.to_name,
-                                             db_binding=namespace.binding,
-                                             dry_run=namespace.dry_run,
-                                             no_confirm=namespace.yes)
-
-
-def drop_columns(config_dict, namespace):
-    """Drop (remove) one or more columns in a WeeWX database."""
-    weectllib.database_actions.drop_columns(config_dict,
-                                            column_names=namespace.column_names,
-                                            db_binding=namespace.binding,
-                                            dry_run=namespace.dry_run,
-                                            no_confirm=namespace.yes)
-
-
-def reconfigure_database(config_dict, namespace):
-    """Replicate a database, using current configuration settings."""
-    weectllib.database_actions.reconfigure_database(config_dict,
-                                                    db_binding=namespace.binding,
-                                                    dry_run=namespace.dry_run,
-                                                    no_confirm=namespace.yes)
-
-
-def transfer_database(config_dict, namespace):
-    """Copy a database to a new database."""
-    weectllib.database_actions.transfer_database(config_dict,
-                                                 dest_binding=namespace.dest_binding,
-                                                 db_binding=namespace.binding,
-                                                 dry_run=namespace.dry_run,
-                                                 no_confirm=namespace.yes)
-
-
-def calc_missing(config_dict, namespace):
-    """Calculate derived variables in a database."""
-    weectllib.database_actions.calc_missing(config_dict,
-                                            date=namespace.date,
-                                            from_date=namespace.from_date,
-                                            to_date=namespace.to_date,
-                                            db_binding=namespace.binding,
-                                            tranche=namespace.tranche,
-                                            dry_run=namespace.dry_run,
-                                            no_confirm=namespace.yes)
-
-
-def check(config_dict, namespace):
-    """Check the integrity of a WeeWX database."""
-    weectllib.database_actions.check(config_dict,
-                                     namespace.binding)
-
-
-def update_database(config_dict, namespace):
-    weectllib.database_actions.update_database(config_dict,
-                                               db_binding=namespace.binding,
-                                               dry_run=namespace.dry_run,
-                                               no_confirm=namespace.yes)
-
-
-def reweight_daily(config_dict, namespace):
-    """Recalculate the weights in a WeeWX database."""
-    weectllib.database_actions.reweight_daily(config_dict,
-                                              date=namespace.date,
-                                              from_date=namespace.from_date,
-                                              to_date=namespace.to_date,
-                                              db_binding=namespace.binding,
-                                              dry_run=namespace.dry_run,
-                                              no_confirm=namespace.yes)
-
-
-def _add_common_args(subparser):
-    """Add options used by most of the subparsers"""
-    subparser.add_argument('--config',
-                           metavar='FILENAME',
-                           help='Path to configuration file. '
-                                f'Default is "{weecfg.default_config_path}".')
-    subparser.add_argument("--binding", metavar="BINDING-NAME", default='wx_binding',
-                           help="The data binding to use. Default is 'wx_binding'.")
-    subparser.add_argument('--dry-run',
-                           action='store_true',
-                           help='Print what would happen, but do not actually do it.')
-    subparser.add_argument('-y', '--yes', action='store_true',
-                           help="Don't ask for confirmation. Just do it.")
+    reweight_parser.set_defaults(action_func=run_action)
+
+
+_action_builders = {
+    'create': _build_create,
+    'drop-daily': _build_drop_daily,
+    'rebuild-daily': _build_rebuild_daily,
+    'add-column': _build_add_column,
+    'rename-column': _build_rename_column,
+    'drop-columns': _build_drop_columns,
+    'reconfigure': _build_reconfigure,
+    'transfer': _build_transfer,
+    'calc-missing': _build_calc_missing,
+    'check': _build_check,
+    'update': _build_update,
+    'reweight': _build_reweight,
+}
+
+
+# ------------------ Dispatching to the database action functions ---------------- #
+# For each action, the function in weectllib.database_actions that implements it, and the
+# namespace attributes it takes, in addition to the binding and, where applicable, the dry-run
+# and confirmation flags.
+_action_funcs = {
+    'create': ('create_database', ()),
+    'drop-daily': ('drop_daily', ()),
+    'rebuild-daily': ('rebuild_daily', ('date', 'from_date', 'to_date')),
+    'add-column': ('add_column', ('column_name', 'column_type')),
+    'rename-column': ('rename_column', ('from_name', 'to_name')),
+    'drop-columns': ('drop_columns', ('column_names',)),
+    'reconfigure': ('reconfigure_database', ()),
+    'transfer': ('transfer_database', ('dest_binding',)),
+    'calc-missing': ('calc_missing', ('date', 'from_date', 'to_date', 'tranche')),
+    'check': ('check', ()),
+    'update': ('update_database', ()),
+    'reweight': ('reweight_daily', ('date', 'from_date', 'to_date')),
+}
+
+
+# Actions simple enough that a dry run can just say what would be done, without opening the
+# database.
+_dry_run_messages = {
+    'add-column': "Would add column '{column_name}' of type '{column_type}' "
+                  "to database '{database_name}'.",
+    'rename-column': "Would rename column '{from_name}' to '{to_name}' "
+                     "in database '{database_name}'.",
+    'drop-columns': "Would drop column(s) '{column_names}' from database '{database_name}'.",
+}
+
+
+def run_action(config_dict, namespace):
+    """Call the database action function that implements the action in the namespace."""
+    func_name, arg_names = _action_funcs[namespace.action]
+    kwargs = {arg_name: getattr(namespace, arg_name) for arg_name in arg_names}
+
+    if getattr(namespace, 'dry_run', False) and namespace.action in _dry_run_messages:
+        # Resolving the binding does not open the database, but it does make sure the binding
+        # exists, just like a real run would.
+        manager_dict = weewx.manager.get_manager_dict_from_config(config_dict, namespace.binding)
+        database_name = manager_dict['database_dict']['database_name']
+        if 'column_names' in kwargs:
+            kwargs['column_names'] = ', '.join(kwargs['column_names'])
+        print(_dry_run_messages[namespace.action].format(database_name=database_name, **kwargs))
+        return
+
+    import weectllib.database_actions
+    kwargs['db_binding'] = namespace.binding
+    # Only the actions that can change the database have the --dry-run and --yes options
+    if hasattr(namespace, 'dry_run'):
+        kwargs['dry_run'] = namespace.dry_run
+        kwargs['no_confirm'] = namespace.yes
+    getattr(weectllib.database_actions, func_name)(config_dict, **kwargs)
+
+
+@functools.lru_cache(maxsize=None)
+def _common_parser(mutating=True):
+    """Return a parent parser holding the options shared by the actions. Actions that can change
+    the database also get --dry-run and --yes."""
+    common_parser = argparse.ArgumentParser(add_help=False)
+    common_parser.add_argument('--config',
+                               metavar='FILENAME',
+                               help='Path to configuration file. '
+                                    f'Default is "{weecfg.default_config_path}".')
+    common_parser.add_argument("--binding", metavar="BINDING-NAME", default='wx_binding',
+                               help=_binding_help)
+    if mutating:
+        common_parser.add_argument('--dry-run', action='store_true', help=_dry_run_help)
+        common_parser.add_argument('-y', '--yes', action='store_true', help=_yes_help)
+    return common_parser
@@ -0,0 +1,245 @@
+#
+#      Copyright (c) 2024 Tom Keffer <tkeffer@gmail.com>
+#
+#      See the file LICENSE.txt for your full rights.
+#
+"""Test the parsers and dispatching of the 'weectl database' subcommand."""
+
+import argparse
+import datetime
+import inspect
+import io
+import unittest
+from unittest import mock
+
+import configobj
+
+import weectllib.database_actions
+import weectllib.database_cmd
+import weewx
+from weeutil.weeutil import bcolors
+
+# Minimal command lines that will parse for each action
+ACTION_ARGS = {
+    'create': [],
+    'drop-daily': [],
+    'rebuild-daily': ['--date', '2024-02-03'],
+    'add-column': ['extraTemp4', '--type', 'int'],
+    'rename-column': ['extraTemp4', 'extraTemp5'],
+    'drop-columns': ['extraTemp4', 'extraTemp5'],
+    'reconfigure': [],
+    'transfer': ['--dest-binding', 'new_binding'],
+    'calc-missing': ['--tranche', '5'],
+    'check': [],
+    'update': [],
+    'reweight': [],
+}
+
+
+def get_config_dict():
+    """Return a minimal configuration dictionary, with a single binding 'wx_binding'."""
+    config_snippet = """
+    WEEWX_ROOT = /home/weewx
+    [DataBindings]
+        [[wx_binding]]
+            database = archive_sqlite
+    [Databases]
+        [[archive_sqlite]]
+            database_name = weewx.sdb
+            database_type = SQLite
+    [DatabaseTypes]
+        [[SQLite]]
+            driver = weedb.sqlite
+            SQLITE_ROOT = %(WEEWX_ROOT)s/archive
+    """
+    return configobj.ConfigObj(io.StringIO(config_snippet), encoding='utf-8')
+
+
+def build(*argv):
+    """Build the parsers the way weectl would for the given command line. Return the top-level
+    parser and the 'database' parser."""
+    parser = argparse.ArgumentParser()
+    subparsers = parser.add_subparsers(dest='subcommand')
+    with mock.patch('sys.argv', list(argv)):
+        weectllib.database_cmd.add_subparser(subparsers)
+    return parser, subparsers.choices['database']
+
+
+def action_parsers(database_parser):
+    """Return a dictionary of the action parsers of the 'database' parser, keyed by action."""
+    return database_parser._subparsers._group_actions[0].choices
+
+
+def is_stub(parser):
+    """A stub parser has no options besides --help."""
+    return set(parser._option_string_actions) == {'-h', '--help'}
+
+
+def parse(*args):
+    """Build the 'database' parser the way weectl would for the given command line, then
+    parse it."""
+    argv = ['weectl', 'database'] + list(args)
+    parser, _ = build(*argv)
+    return parser.parse_args(argv[1:])
+
+
+class ParserTest(unittest.TestCase):
+
+    def test_every_action_has_a_builder(self):
+        self.assertEqual(list(weectllib.database_cmd._action_help),
+                         list(weectllib.database_cmd._action_funcs))
+        self.assertEqual(list(weectllib.database_cmd._action_help),
+                         list(weectllib.database_cmd._action_usages))
+
+    def test_only_chosen_action_is_built(self):
+        _, database_parser = build('weectl', 'database', 'rebuild-daily', '--date', '2024-02-03')
+        parsers = action_parsers(database_parser)
+        # Every action is still a valid choice...
+        self.assertEqual(list(parsers), list(weectllib.database_cmd._action_help))
+        # ... but only the chosen one is fully built
+        self.assertIn('--date', parsers['rebuild-daily']._option_string_actions)
+        for action, action_parser in parsers.items():
+            if action != 'rebuild-daily':
+                self.assertTrue(is_stub(action_parser), action)
+
+    def test_no_action(self):
+        """With no action, every action parser is a stub."""
+        _, database_parser = build('weectl', 'database')
+        self.assertTrue(all(is_stub(p) for p in action_parsers(database_parser).values()))
+
+    def test_help(self):
+        """'weectl database --help' lists every action, using the stubs."""
+        for option in ('-h', '--help'):
+            _, database_parser = build('weectl', 'database', option)
+            self.assertEqual(database_parser.usage, weectllib.database_cmd._database_usage())
+            parsers = action_parsers(database_parser)
+            self.assertEqual(list(parsers), list(weectllib.database_cmd._action_help))
+            self.assertTrue(all(is_stub(p) for p in parsers.values()))
+            help_text = database_parser.format_help()
+            for action_help in weectllib.database_cmd._action_help.values():
+                self.assertIn(action_help.split()[0], help_text)
+
+    def test_unknown_action(self):
+        _, database_parser = build('weectl', 'database', 'bogus')
+        self.assertTrue(all(is_stub(p) for p in action_parsers(database_parser).values()))
+
+    def test_option_before_action(self):
+        """If an option comes before the action, the 'database' parser needs its full usage."""
+        for option in ('--help', '--bogus'):
+            _, database_parser = build('weectl', 'database', option, 'create')
+            self.assertEqual(database_parser.usage, weectllib.database_cmd._database_usage())
+            self.assertTrue(all(is_stub(p) for p in action_parsers(database_parser).values()))
+
+    def test_common_args(self):
+        namespace = parse('create', '--binding', 'foo_binding', '--dry-run')
+        self.assertEqual(namespace.action, 'create')
+        self.assertEqual(namespace.binding, 'foo_binding')
+        self.assertTrue(namespace.dry_run)
+        self.assertFalse(namespace.yes)
+        self.assertIsNone(namespace.config)
+
+    def test_column_type(self):
+        self.assertEqual(parse('add-column', 'foo').column_type, 'REAL')
+        self.assertEqual(parse('add-column', 'foo', '--type', 'int').column_type, 'INTEGER')
+        self.assertEqual(parse('add-column', 'foo', '--type', 'real not null').column_type,
+                         'REAL NOT NULL')
+
+    def test_dates(self):
+        namespace = parse('rebuild-daily', '--from', '2024-02-03', '--to', '2024-03-04')
+        self.assertEqual(namespace.from_date, datetime.date(2024, 2, 3))
+        self.assertEqual(namespace.to_date, datetime.date(2024, 3, 4))
+        self.assertIsNone(namespace.date)
+        with mock.patch('sys.stderr'):
+            with self.assertRaises(SystemExit):
+                parse('reweight', '--date', '2024-02-30')
+
+    def test_other_subcommand(self):
+        """If some other subcommand is running, the database parser is just a placeholder."""
+        for argv in (['weectl', 'station', 'create'],
+                     ['weectl', 'station', 'create', '--config', 'database'],
+                     ['weectl', '--help'],
+                     ['weectl']):
+            parser, database_parser = build(*argv)
+            self.assertIsNone(database_parser._subparsers, argv)
+            # It should still show up in the top-level help
+            self.assertIn(weectllib.database_cmd._database_help, parser.format_help())
+
+
+class UsageTest(unittest.TestCase):
+
+    def usage(self, argv, stdout_tty, stderr_tty, environ=None):
+        with mock.patch('sys.argv', argv), \
+                mock.patch('sys.stdout.isatty', return_value=stdout_tty), \
+                mock.patch('sys.stderr.isatty', return_value=stderr_tty), \
+                mock.patch.dict('os.environ', environ or {}, clear=True):
+            return weectllib.database_cmd._usage('check')
+
+    def test_help_to_tty(self):
+        usage = self.usage(['weectl', 'database', 'check', '--help'], True, False)
+        self.assertTrue(usage.startswith(bcolors.BOLD))
+        self.assertTrue(usage.endswith(bcolors.ENDC))
+
+    def test_help_piped(self):
+        usage = self.usage(['weectl', 'database', 'check', '--help'], False, True)
+        self.assertEqual(usage, weectllib.database_cmd._action_usages['check'])
+
+    def test_error_to_tty(self):
+        """Without --help, the usage is only shown with an error message, on stderr."""
+        usage = self.usage(['weectl', 'database', 'check', '--bogus'], False, True)
+        self.assertTrue(usage.startswith(bcolors.BOLD))
+
+    def test_error_redirected(self):
+        usage = self.usage(['weectl', 'database', 'check', '--bogus'], True, False)
+        self.assertEqual(usage, weectllib.database_cmd._action_usages['check'])
+
+    def test_no_color(self):
+        usage = self.usage(['weectl', 'database', 'check', '--help'], True, True,
+                           {'NO_COLOR': '1'})
+        self.assertEqual(usage, weectllib.database_cmd._action_usages['check'])
+
+
+class DispatchTest(unittest.TestCase):
+
+    def test_dispatch(self):
+        """Make sure each action calls its action function with arguments it accepts."""
+        for action, args in ACTION_ARGS.items():
+            with self.subTest(action=action):
+                namespace = parse(action, *args)
+                func_name = weectllib.database_cmd._action_funcs[action][0]
+                func = getattr(weectllib.database_actions, func_name)
+                with mock.patch.object(weectllib.database_actions, func_name) as mock_func:
+                    namespace.action_func({}, namespace)
+                mock_func.assert_called_once()
+                call_args, call_kwargs = mock_func.call_args
+                # This will raise a TypeError if the arguments do not match the signature:
+                inspect.signature(func).bind(*call_args, **call_kwargs)
+
+    def test_dry_run_preview(self):
+        """A dry run of the simple column actions should not touch the database."""
+        namespace = parse('drop-columns', 'extraTemp4', 'extraTemp5', '--dry-run')
+        with mock.patch.object(weectllib.database_actions, 'drop_columns') as mock_func, \
+                mock.patch('builtins.print') as mock_print:
+            namespace.action_func(get_config_dict(), namespace)
+        mock_func.assert_not_called()
+        mock_print.assert_called_once_with("Would drop column(s) 'extraTemp4, extraTemp5' "
+                                           "from database 'weewx.sdb'.")
+
+    def test_dry_run_bad_binding(self):
+        """A dry run should reject a binding that a real run would reject."""
+        namespace = parse('add-column', 'extraTemp4', '--binding', 'bogus', '--dry-run')
+        with mock.patch('builtins.print') as mock_print:
+            with self.assertRaises(weewx.UnknownBinding):
+                namespace.action_func(get_config_dict(), namespace)
+        mock_print.assert_not_called()
+
+    def test_dry_run_delegated(self):
+        """Other actions still need the database, even for a dry run."""
+        namespace = parse('create', '--dry-run')
+        with mock.patch.object(weectllib.database_actions, 'create_database') as mock_func:
+            namespace.action_func({}, namespace)
+        mock_func.assert_called_once_with({}, db_binding='wx_binding', dry_run=True,
+                                          no_confirm=False)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -58,3 +58,14 @@ class ParseTest(unittest.TestCase):
         self.assertIsInstance(from_val, datetime.datetime)
         self.assertEqual(from_val, datetime.datetime(2021, 5, 13, 8, 30, 5))
         self.assertEqual(to_val, datetime.datetime(2021, 6, 2, 21, 11, 55))
+
+    def test_parse_date_objects(self):
+        from_val, to_val = parse_dates(from_date=datetime.date(2021, 5, 13),
+                                       to_date=datetime.date(2021, 6, 2))
+        self.assertEqual(from_val, datetime.date(2021, 5, 13))
+        self.assertEqual(to_val, datetime.date(2021, 6, 2))
+
+        from_valt, to_valt = parse_dates(date=datetime.date(2021, 5, 13), as_datetime=True)
+        self.assertIsInstance(from_valt, datetime.datetime)
+        self.assertEqual(from_valt, datetime.datetime(2021, 5, 13))
+        self.assertEqual(from_valt, to_valt)
@@ -268,11 +268,15 @@ class Cursor(weedb.Cursor):
 
         table: The name of the table from which the column(s) are to be dropped.
 
-        column_names: A set (or list) of column names to be dropped. It is not an error to try to drop
-        a non-existent column.
+        column_names: A set (or list) of column names to be dropped. They are all dropped in a
+        single statement, so if any of them does not exist, a weedb.NoColumnError will be raised
+        and none of them will be dropped.
         """
-        for column_name in column_names:
-            self.execute("ALTER TABLE %s DROP COLUMN %s;" % (table, column_name))
+        if not column_names:
+            return
+        # Drop them all in a single statement, so the table gets rebuilt only once.
+        drop_str = ", ".join("DROP COLUMN %s" % column_name for column_name in column_names)
+        self.execute("ALTER TABLE %s %s;" % (table, drop_str))
 
     def close(self):
         try:
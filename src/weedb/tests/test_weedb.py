@@ -145,6 +145,29 @@ class Common(unittest.TestCase):
                 with self.assertRaises(weedb.OperationalError):
                     _cursor.execute("SELECT dateTime, foo FROM test1")
 
+    def test_drop_columns(self):
+        self.populate_db()
+        with weedb.connect(self.db_dict) as _connect:
+            with weedb.Transaction(_connect) as _cursor:
+                _cursor.drop_columns('test1', ['mintime', 'max', 'descript'])
+            self.assertEqual(_connect.columnsOf('test1'),
+                             ['dateTime', 'min', 'maxtime', 'sum', 'count'])
+            # The data in the remaining columns should be untouched
+            with _connect.cursor() as _cursor:
+                _cursor.execute("SELECT dateTime, min FROM test1 WHERE dateTime = 3")
+                self.assertEqual(_cursor.fetchone(), (3, 30.0))
+            # Dropping nothing should do nothing
+            with weedb.Transaction(_connect) as _cursor:
+                _cursor.drop_columns('test1', [])
+            self.assertEqual(_connect.columnsOf('test1'),
+                             ['dateTime', 'min', 'maxtime', 'sum', 'count'])
+            # A missing column should cause none of them to be dropped
+            with self.assertRaises(weedb.NoColumnError):
+                with weedb.Transaction(_connect) as _cursor:
+                    _cursor.drop_columns('test1', ['min', 'foo'])
+            self.assertEqual(_connect.columnsOf('test1'),
+                             ['dateTime', 'min', 'maxtime', 'sum', 'count'])
+
     def test_rollback(self):
         # Create the database and schema
         weedb.create(self.db_dict)
@@ -247,7 +270,7 @@ class TestMySQL(Common):
 def suite():
     tests = ['test_drop', 'test_double_create', 'test_no_db', 'test_no_tables',
              'test_create', 'test_bad_table', 'test_select', 'test_bad_select',
-             'test_rollback', 'test_transaction', 'test_variable']
+             'test_drop_columns', 'test_rollback', 'test_transaction', 'test_variable']
     return unittest.TestSuite(list(map(TestSqlite, tests)) + list(map(TestMySQL, tests)))
 
 